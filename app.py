@@ -1,17 +1,54 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, StreamingResponse
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import TYPE_CHECKING, Optional, Tuple
 import os
-import cv2
 import asyncio
+import hashlib
+import logging
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
-from misumi_xy_wrapper import MisumiXYWrapper, AxisName, DriveMode
+from misumi_xy_wrapper import MisumiXYWrapper, AsyncMisumiXYWrapper, AxisName, DriveMode
 from well_plate_config import WellPlateCalculator, WellPosition, WellPlateConfig
 
-app = FastAPI(title="Misumi XY Stage Controller")
+if TYPE_CHECKING:
+    import cv2
+
+# libjpeg-turbo encoder for the camera stream; falls back to cv2.imencode when
+# PyTurboJPEG or the native libjpeg-turbo library is not installed
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJFLAG_FASTDCT
+    jpeg: Optional[TurboJPEG] = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    jpeg = None
+
+# Live preview quality; lower than the encoders' defaults to cut CPU and bandwidth
+JPEG_QUALITY = 75
+
+# Multipart framing around each JPEG in the camera stream
+FRAME_PREFIX = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+FRAME_SUFFIX = b'\r\n'
+
+# Web interface, read into memory at startup
+INDEX_PATH = "static/index.html"
+index_html: bytes = b""
+
+# Lookup of well position names accepted by /move/well
+WELL_POSITIONS = {p.value: p for p in WellPosition}
+WELL_POSITION_CHOICES = ', '.join(WELL_POSITIONS)
+
+# Capture resolution requested from the camera driver
+CAMERA_FRAME_WIDTH = 1280
+CAMERA_FRAME_HEIGHT = 720
+
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Misumi XY Stage Controller", default_response_class=ORJSONResponse)
 
 # Add CORS middleware to allow web app to connect
 app.add_middleware(
@@ -22,27 +59,61 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves the camera stream (already-compressed JPEG parts) untouched"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/camera/stream":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress JSON and HTML responses for clients that accept gzip
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Global stage instance (will be initialized on startup)
-stage: Optional[MisumiXYWrapper] = None
+stage: Optional[AsyncMisumiXYWrapper] = None
 # Use 24-well plate as default
 calculator: WellPlateCalculator = WellPlateCalculator(WellPlateCalculator.STANDARD_24_WELL)
+# OpenCV module, imported on first camera use to keep startup fast
+cv2_module = None
+# cv2.imencode parameters, built once OpenCV is imported
+cv2_jpeg_params: list = []
 # Global camera instance
-camera: Optional[cv2.VideoCapture] = None
+camera: Optional["cv2.VideoCapture"] = None
+# Background thread that reads and encodes camera frames
+capture_thread: Optional[threading.Thread] = None
+# Single-slot buffer holding the most recently encoded frame
+latest_frame = {"bytes": b"", "seq": 0}
+frame_lock = threading.Lock()
+frame_ready = threading.Event()
+# Set while the capture thread is delivering frames
+camera_active = threading.Event()
+# Serializes camera start/stop so overlapping requests can't open two captures; created on startup
+camera_lock: Optional[asyncio.Lock] = None
 
 # Pydantic models for request/response
 class MoveXYRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     x: float
     y: float
 
 class MoveWellRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     well: str  # e.g., "A1", "B12"
     position: str = "center"  # center, top, bottom, left, right, etc.
 
 class ConfigUpdateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     origin_x: float
     origin_y: float
 
 class WellPlateConfigRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     rows: int
     cols: int
     well_spacing_x: float
@@ -52,30 +123,147 @@ class WellPlateConfigRequest(BaseModel):
     plate_origin_y: float = 0.0
 
 class StageConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     port: str
     baudrate: int = 38400
 
 class PositionResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     x: float
     y: float
     well: Optional[str] = None
 
+# Pre-serialized well plate responses, rebuilt whenever the plate changes
+wells_cache: bytes = b""
+wells_etag: str = ""
+wellplate_config_cache: bytes = b""
+wellplate_config_etag: str = ""
+
+def refresh_wellplate_cache():
+    """Serialize the /wells and /config/wellplate bodies for the current calculator"""
+    global wells_cache, wells_etag, wellplate_config_cache, wellplate_config_etag
+    config = calculator.config
+    wells_cache = orjson.dumps({
+        "wells": calculator.get_all_wells(),
+        "config": {
+            "rows": config.rows,
+            "cols": config.cols,
+            "name": config.name
+        }
+    })
+    wells_etag = f'"{hashlib.md5(wells_cache).hexdigest()}"'
+    wellplate_config_cache = orjson.dumps({
+        "rows": config.rows,
+        "cols": config.cols,
+        "well_spacing_x": config.well_spacing_x,
+        "well_spacing_y": config.well_spacing_y,
+        "well_diameter": config.well_diameter,
+        "plate_origin_x": config.plate_origin_x,
+        "plate_origin_y": config.plate_origin_y,
+        "name": config.name
+    })
+    wellplate_config_etag = f'"{hashlib.md5(wellplate_config_cache).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, lists and '*' allowed)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+def cached_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return a pre-serialized JSON body, or 304 if the client already has it"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+refresh_wellplate_cache()
+
+# Stage calls run in FIFO order on the stage's own worker thread (AsyncMisumiXYWrapper);
+# camera open/close gets a single-worker executor of its own
+camera_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="camera")
+
+async def run_camera(func, *args):
+    """Run a blocking camera call on the camera thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(camera_executor, func, *args)
+
+def drive_xy(controller: MisumiXYWrapper, x: Optional[float], y: Optional[float]):
+    """Start moving the stage to absolute XY coordinates (doesn't wait for completion)"""
+    if x is not None:
+        controller.drive_absolute(AxisName.X, x)
+    if y is not None:
+        controller.drive_absolute(AxisName.Y, y)
+
+# Pending move targets, consumed by move_worker; created on startup
+move_queue: Optional[asyncio.Queue] = None
+move_worker_task: Optional[asyncio.Task] = None
+
+def queue_move(x: Optional[float], y: Optional[float]):
+    """Queue a move target, dropping the oldest pending target if the queue is full"""
+    try:
+        move_queue.put_nowait((x, y))
+    except asyncio.QueueFull:
+        move_queue.get_nowait()
+        move_queue.put_nowait((x, y))
+
+def clear_pending_moves():
+    """Drop move targets that have not been sent to the stage yet"""
+    while not move_queue.empty():
+        move_queue.get_nowait()
+
+async def move_worker():
+    """Send queued moves to the stage, skipping targets superseded by newer ones"""
+    while True:
+        x, y = await move_queue.get()
+        # Only the most recent target matters; older ones would be overridden anyway
+        while not move_queue.empty():
+            x, y = move_queue.get_nowait()
+
+        if not stage:
+            continue
+        try:
+            # One call on the stage thread so nothing runs between the X and Y commands
+            await stage.run(drive_xy, stage.stage, x, y)
+        except Exception as e:
+            logger.error("Movement to X=%s, Y=%s failed: %s", x, y, e)
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the stage on startup if COM port is configured"""
-    global stage
+    global stage, index_html, move_queue, move_worker_task, camera_lock
     # You'll need to configure your COM port here
     # For now, we'll delay initialization until the configure endpoint is called
-    pass
+
+    move_queue = asyncio.Queue(maxsize=4)
+    move_worker_task = asyncio.create_task(move_worker())
+    camera_lock = asyncio.Lock()
+
+    if os.path.exists(INDEX_PATH):
+        with open(INDEX_PATH, "rb") as f:
+            index_html = f.read()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Disconnect from stage and camera on shutdown"""
     global stage, camera
+    if move_worker_task:
+        move_worker_task.cancel()
     if stage:
-        stage.disconnect()
-    if camera:
-        camera.release()
+        await stage.close()
+    async with camera_lock:
+        if camera:
+            camera_active.clear()
+            cam, camera = camera, None
+            await run_camera(close_camera, cam, capture_thread)
+    camera_executor.shutdown(wait=False)
 
 @app.post("/configure")
 async def configure_stage(config: StageConfig):
@@ -86,8 +274,10 @@ async def configure_stage(config: StageConfig):
         if stage:
             if stage.port == config.port and stage.baudrate == config.baudrate and stage.connected:
                 return {"status": "connected", "port": config.port, "message": "Already connected"}
-            stage.disconnect()
-        stage = MisumiXYWrapper(port=config.port, baudrate=config.baudrate, auto_initialize=False)
+            clear_pending_moves()
+            await stage.close()
+            stage = None
+        stage = await AsyncMisumiXYWrapper.open(port=config.port, baudrate=config.baudrate, auto_initialize=False)
         return {"status": "connected", "port": config.port}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to connect: {str(e)}")
@@ -97,18 +287,11 @@ async def move_xy(request: MoveXYRequest):
     """Move stage to absolute XY coordinates"""
     if not stage:
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
-    
-    print(request.y)
-    try:
-        # Start the movement for each axis (don't wait for completion)
-        if request.x is not None:
-            stage.drive_absolute(AxisName.X, request.x)
-        if request.y is not None:
-            stage.drive_absolute(AxisName.Y, request.y)
 
-        return {"status": "moving", "x": request.x, "y": request.y}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Movement failed: {str(e)}")
+    # Hand the target to the move worker (don't wait for the command or the movement)
+    queue_move(request.x, request.y)
+
+    return {"status": "moving", "x": request.x, "y": request.y}
 
 @app.post("/move/well")
 async def move_well(request: MoveWellRequest):
@@ -116,23 +299,18 @@ async def move_well(request: MoveWellRequest):
     if not stage:
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
 
-    try:
-        # Parse position
-        try:
-            position = WellPosition(request.position.lower())
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid position. Must be one of: {', '.join([p.value for p in WellPosition])}"
-            )
+    # Parse position
+    position = WELL_POSITIONS.get(request.position.lower())
+    if position is None:
+        raise HTTPException(status_code=400, detail=f"Invalid position. Must be one of: {WELL_POSITION_CHOICES}")
 
+    try:
         # Calculate target coordinates
         x, y = calculator.get_well_position(request.well, position)
-        print(f"Moving to well {request.well} at position {request.position}: X={x}, Y={y}")
+        logger.debug("Moving to well %s at position %s: X=%s, Y=%s", request.well, request.position, x, y)
 
-        # Start the movement for each axis (don't wait for completion)
-        stage.drive_absolute(AxisName.X, x)
-        stage.drive_absolute(AxisName.Y, y)
+        # Hand the target to the move worker (don't wait for the command or the movement)
+        queue_move(x, y)
 
         return {
             "status": "moving",
@@ -146,21 +324,22 @@ async def move_well(request: MoveWellRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Movement failed: {str(e)}")
 
-@app.get("/position")
+@app.get("/position", response_model=PositionResponse)
 async def get_position():
     """Get current stage position"""
     if not stage:
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
 
     try:
-        x = stage.get_position(AxisName.X)
-        y = stage.get_position(AxisName.Y)
+        positions = await stage.get_positions((AxisName.X, AxisName.Y))
 
-        return PositionResponse(x=x, y=y)
+        # Polled frequently by the UI: serialize directly instead of building a PositionResponse
+        return Response(
+            orjson.dumps({"x": positions[AxisName.X], "y": positions[AxisName.Y], "well": None}),
+            media_type="application/json"
+        )
     except Exception as e:
-        import traceback
-        print(f"Error getting position: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error getting position: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get position: {str(e)}")
 
 @app.post("/initialize")
@@ -170,7 +349,8 @@ async def initialize_stage():
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
 
     try:
-        stage.initialize()
+        clear_pending_moves()
+        await stage.initialize()
         return {"status": "success", "message": "Stage initialized and homed"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Initialization failed: {str(e)}")
@@ -182,11 +362,14 @@ async def home_stage():
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
 
     try:
-        success = stage.home_all_axes()
+        clear_pending_moves()
+        success = await stage.home_all_axes()
         if success:
             return {"status": "success", "message": "All axes homed"}
         else:
             raise HTTPException(status_code=500, detail="Homing timed out")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Homing failed: {str(e)}")
 
@@ -197,27 +380,23 @@ async def stop_stage():
         raise HTTPException(status_code=400, detail="Stage not connected. Call /configure first.")
 
     try:
-        stage.stop()
+        # Make sure no queued move starts after the stop
+        clear_pending_moves()
+        await stage.stop()
         return {"status": "success", "message": "All axes stopped"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Stop failed: {str(e)}")
 
 @app.get("/wells")
-async def get_wells():
+async def get_wells(request: Request):
     """Get list of all available wells"""
-    return {
-        "wells": calculator.get_all_wells(),
-        "config": {
-            "rows": calculator.config.rows,
-            "cols": calculator.config.cols,
-            "name": calculator.config.name
-        }
-    }
+    return cached_json_response(request, wells_cache, wells_etag)
 
 @app.post("/calibrate/origin")
 async def calibrate_origin(request: ConfigUpdateRequest):
     """Set the current position as the origin (well A1 center)"""
     calculator.update_origin(request.origin_x, request.origin_y)
+    refresh_wellplate_cache()
     return {
         "status": "success",
         "message": f"Origin set to ({request.origin_x}, {request.origin_y})"
@@ -238,6 +417,7 @@ async def configure_wellplate(config: WellPlateConfigRequest):
             plate_origin_y=config.plate_origin_y
         )
         calculator = WellPlateCalculator(custom_config)
+        refresh_wellplate_cache()
         return {
             "status": "success",
             "message": f"Well plate configured: {custom_config.name}",
@@ -251,91 +431,189 @@ async def configure_wellplate(config: WellPlateConfigRequest):
         raise HTTPException(status_code=400, detail=f"Invalid configuration: {str(e)}")
 
 @app.get("/config/wellplate")
-async def get_wellplate_config():
+async def get_wellplate_config(request: Request):
     """Get current well plate configuration"""
-    return {
-        "rows": calculator.config.rows,
-        "cols": calculator.config.cols,
-        "well_spacing_x": calculator.config.well_spacing_x,
-        "well_spacing_y": calculator.config.well_spacing_y,
-        "well_diameter": calculator.config.well_diameter,
-        "plate_origin_x": calculator.config.plate_origin_x,
-        "plate_origin_y": calculator.config.plate_origin_y,
-        "name": calculator.config.name
-    }
+    return cached_json_response(request, wellplate_config_cache, wellplate_config_etag)
 
 @app.post("/camera/start")
 async def start_camera():
     """Initialize and start the camera"""
-    global camera
+    global camera, capture_thread
     try:
-        if camera is not None and camera.isOpened():
-            return {"status": "success", "message": "Camera already running"}
-
-        # Try multiple camera indices (0-5) to find available camera
-        for i in range(6):
-            print(f"Trying camera index {i}...")
-            camera = cv2.VideoCapture(i)
-            if camera.isOpened():
-                # Test if we can actually read a frame
-                ret, _ = camera.read()
-                if ret:
-                    print(f"Successfully opened camera at index {i}")
-                    return {"status": "success", "message": f"Camera started at index {i}"}
-                else:
-                    camera.release()
-                    camera = None
-            else:
-                camera = None
-
-        # If we get here, no camera was found
-        raise HTTPException(status_code=500, detail="No camera found. Tried indices 0-5.")
+        async with camera_lock:
+            if camera_active.is_set():
+                return {"status": "success", "message": "Camera already running"}
+            if camera is not None:
+                # Capture ended on its own (e.g. the camera was unplugged); release it before reopening
+                cam, camera = camera, None
+                await run_camera(close_camera, cam, capture_thread)
+
+            # Try multiple camera indices (0-5) to find available camera
+            opened = await run_camera(open_camera)
+            if opened is None:
+                raise HTTPException(status_code=500, detail="No camera found. Tried indices 0-5.")
+
+            camera, index, passthrough = opened
+            logger.info("Successfully opened camera at index %s", index)
+            with frame_lock:
+                latest_frame["bytes"] = b""
+            camera_active.set()
+            capture_thread = threading.Thread(target=capture_loop, args=(camera, passthrough), daemon=True)
+            capture_thread.start()
+            return {"status": "success", "message": f"Camera started at index {index}"}
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error starting camera: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error starting camera: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start camera: {str(e)}")
 
 @app.post("/camera/stop")
 async def stop_camera():
     """Stop the camera"""
-    global camera
+    global camera, capture_thread
     try:
-        if camera:
-            camera.release()
-            camera = None
+        async with camera_lock:
+            if camera:
+                # Stop the capture thread before the camera is released
+                camera_active.clear()
+                cam, camera = camera, None
+                await run_camera(close_camera, cam, capture_thread)
+                capture_thread = None
         return {"status": "success", "message": "Camera stopped"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to stop camera: {str(e)}")
 
-def generate_frames():
-    """Generator function to yield camera frames"""
-    global camera
-    while True:
-        if camera is None or not camera.isOpened():
-            break
-
-        success, frame = camera.read()
-        if not success:
-            break
-
-        # Encode frame as JPEG
-        ret, buffer = cv2.imencode('.jpg', frame)
-        if not ret:
+def get_cv2():
+    """Import OpenCV on first use and return the cached module"""
+    global cv2_module, cv2_jpeg_params
+    if cv2_module is None:
+        import cv2
+        cv2_module = cv2
+        # Baseline (non-progressive) JPEG without Huffman table optimization
+        cv2_jpeg_params = [
+            cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+        ]
+    return cv2_module
+
+def open_camera() -> Optional[Tuple["cv2.VideoCapture", int, bool]]:
+    """
+    Open the first camera index (0-5) that delivers frames.
+
+    Returns:
+        Tuple of (capture, index, passthrough), or None if no camera was found
+    """
+    cv2 = get_cv2()
+    for i in range(6):
+        logger.info("Trying camera index %s...", i)
+        cam = cv2.VideoCapture(i)
+        if cam.isOpened():
+            passthrough = configure_camera(cam)
+            # Test if we can actually read a frame
+            ret, _ = cam.read()
+            if ret:
+                return cam, i, passthrough
+        cam.release()
+    return None
+
+def close_camera(cam: "cv2.VideoCapture", thread: Optional[threading.Thread]):
+    """Stop using a camera; the capture thread releases it once its current read() returns"""
+    if thread is None:
+        cam.release()
+        return
+    # Never release from here: the thread may still be blocked inside read()
+    thread.join(2.0)
+    if thread.is_alive():
+        logger.warning("Capture thread still reading; the camera will be released when it exits")
+
+def configure_camera(cam: "cv2.VideoCapture") -> bool:
+    """
+    Request MJPG frames at the display resolution with minimal driver buffering.
+
+    Returns:
+        True if the driver delivers undecoded MJPG frames that can be streamed as-is
+    """
+    cv2 = get_cv2()
+    mjpg = cv2.VideoWriter_fourcc(*'MJPG')
+    cam.set(cv2.CAP_PROP_FOURCC, mjpg)
+    cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cam.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_FRAME_WIDTH)
+    cam.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_FRAME_HEIGHT)
+
+    if int(cam.get(cv2.CAP_PROP_FOURCC)) != mjpg:
+        return False
+    # Skip OpenCV's decode so read() returns the compressed buffer
+    return bool(cam.set(cv2.CAP_PROP_CONVERT_RGB, 0))
+
+def encode_frame(frame) -> Optional[bytes]:
+    """Encode a BGR frame as JPEG, returning None if encoding fails"""
+    if jpeg is not None:
+        return jpeg.encode(frame, quality=JPEG_QUALITY, pixel_format=TJPF_BGR, flags=TJFLAG_FASTDCT)
+
+    ret, buffer = get_cv2().imencode('.jpg', frame, cv2_jpeg_params)
+    if not ret:
+        return None
+    return buffer.tobytes()
+
+def capture_loop(cam: "cv2.VideoCapture", passthrough: bool):
+    """Read and encode frames into the latest-frame slot until the camera is stopped"""
+    try:
+        while camera_active.is_set() and camera is cam:
+            success, frame = cam.read()
+            if not success:
+                break
+
+            if passthrough and (frame.ndim == 1 or frame.shape[0] == 1):
+                # Driver already delivered a JPEG, forward it without re-encoding
+                frame_bytes = frame.tobytes()
+            else:
+                # Encode frame as JPEG
+                frame_bytes = encode_frame(frame)
+            if frame_bytes is None:
+                continue
+
+            with frame_lock:
+                latest_frame["bytes"] = frame_bytes
+                latest_frame["seq"] += 1
+            frame_ready.set()
+    except Exception:
+        logger.exception("Camera capture failed")
+    finally:
+        if camera is cam:
+            # Capture ended on its own (read or encode failure); /camera/start will reopen
+            camera_active.clear()
+        # Released here, after the last read() has returned, rather than by whoever stopped the camera
+        cam.release()
+        # Wake any streamers so they notice the capture has ended
+        frame_ready.set()
+
+async def generate_frames():
+    """Async generator yielding the most recent camera frame"""
+    last_seq = -1
+    while camera_active.is_set():
+        # Not on the camera executor: each open stream waits here concurrently
+        await asyncio.to_thread(frame_ready.wait, 1.0)
+
+        with frame_lock:
+            frame_bytes = latest_frame["bytes"]
+            seq = latest_frame["seq"]
+
+        if seq == last_seq or not frame_bytes:
+            # Nothing new since the last yield, wait for the next frame
+            frame_ready.clear()
             continue
+        last_seq = seq
 
-        frame_bytes = buffer.tobytes()
-
-        # Yield frame in multipart format
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+        # Yield frame in multipart format as separate chunks to avoid copying the JPEG
+        yield FRAME_PREFIX
+        yield frame_bytes
+        yield FRAME_SUFFIX
 
 @app.get("/camera/stream")
 async def video_stream():
     """Stream video from the camera"""
-    if camera is None or not camera.isOpened():
+    if not camera_active.is_set():
         raise HTTPException(status_code=400, detail="Camera not started. Call /camera/start first.")
 
     return StreamingResponse(
@@ -346,8 +624,33 @@ async def video_stream():
 @app.get("/")
 async def read_root():
     """Serve the web interface"""
-    return FileResponse("static/index.html")
+    if not index_html:
+        raise HTTPException(status_code=404, detail="Web interface not found")
+    return Response(index_html, media_type="text/html", headers={"Cache-Control": "public, max-age=60"})
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets between page loads"""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
 
 # Mount static files directory
 if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
\ No newline at end of file
+    app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+
+    # uvloop is not available on Windows; fall back to the default asyncio loop there
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        timeout_keep_alive=75,
+        access_log=False,
+    )
@@ -13,8 +13,12 @@ Based on the DS102/DS112 Series Operation Manual Ver 2.00
 import serial
 import time
 import logging
-from enum import Enum, auto
-from typing import Union, List, Dict, Tuple, Optional, Any
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from enum import IntEnum, IntFlag
+from typing import Union, List, Dict, Tuple, Optional, Any, Iterable, Callable
 
 
 # Configure logging
@@ -25,7 +29,7 @@ logging.basicConfig(
 logger = logging.getLogger("MisumiXYWrapper")
 
 
-class AxisName(Enum):
+class AxisName(IntEnum):
     """Enum for axis names"""
     X = 1
     Y = 2
@@ -33,16 +37,44 @@ class AxisName(Enum):
     U = 4
     V = 5
     W = 6
-    ALL = "ALL"
 
 
-class Direction(Enum):
+class AxisStatus(IntFlag):
+    """Status binaries of an axis combined into one value (SB1 | SB2 << 8 | SB3 << 16)"""
+    # SB1
+    DIRECTION_CW = 1 << 0
+    MECHANICAL_LIMIT_DETECTED = 1 << 1
+    SOFT_LIMIT_DETECTED = 1 << 2
+    DISCONTINUED = 1 << 3
+    ORIGIN_DETECTED = 1 << 4
+    HOME_POSITION_DETECTED = 1 << 5
+    IN_MOTION = 1 << 6
+    PROGRAM_DRIVING = 1 << 7
+    # SB2
+    CW_MECHANICAL_LIMIT_DETECTED = 1 << 8
+    CCW_MECHANICAL_LIMIT_DETECTED = 1 << 9
+    CW_SOFT_LIMIT_DETECTED = 1 << 10
+    CCW_SOFT_LIMIT_DETECTED = 1 << 11
+    CW_SOFT_LIMIT_ENABLED = 1 << 12
+    CCW_SOFT_LIMIT_ENABLED = 1 << 13
+    # SB3
+    AXIS_SELECTION_AVAILABLE = 1 << 16
+    MICRO_STEP_DRIVER_1 = 1 << 17
+    MICRO_STEP_DRIVER_2 = 1 << 20
+    MICRO_STEP_DRIVER = MICRO_STEP_DRIVER_1 | MICRO_STEP_DRIVER_2  # Either bit set
+
+
+# Axis argument selecting all axes at once (AXIALL)
+ALL_AXES = "ALL"
+
+
+class Direction(IntEnum):
     """Enum for direction"""
     CW = 0
     CCW = 1
 
 
-class DriveMode(Enum):
+class DriveMode(IntEnum):
     """Enum for drive modes"""
     CW = 0
     CCW = 1
@@ -53,13 +85,13 @@ class DriveMode(Enum):
     CCWJ = 6  # Jog drive to CCW
 
 
-class StopMode(Enum):
+class StopMode(IntEnum):
     """Enum for stop modes"""
     EMERGENCY = 0
     REDUCTION = 1
 
 
-class UnitType(Enum):
+class UnitType(IntEnum):
     """Enum for unit types"""
     PULSE = 0
     UM = 1  # μm
@@ -68,7 +100,7 @@ class UnitType(Enum):
     MRAD = 4  # mrad
 
 
-class OriginReturnType(Enum):
+class OriginReturnType(IntEnum):
     """Enum for origin return types"""
     TYPE0 = 0  # Origin return is not implemented (default)
     TYPE1 = 1  # Start to detect to the CCW, Detect the CW side edge of NORG signal, then Detect the CCW side edge of ORG signal
@@ -85,20 +117,150 @@ class OriginReturnType(Enum):
     TYPE12 = 12  # After operated type6, detect CW side edge of TIMING signal
 
 
-class SensorLogic(Enum):
+class SensorLogic(IntEnum):
     """Enum for sensor logic"""
     B_NORMAL_CLOSE = 0  # B point (Normal Close)
     A_NORMAL_OPEN = 1  # A point (Normal Open)
 
 
+# Axis names in axis number order (X = 1 ... W = 6)
+_AXIS_NAMES = ('X', 'Y', 'Z', 'U', 'V', 'W')
+
+# Axis argument (AxisName, 1-6 or name) -> value used in the AXI command
+_AXIS_TO_VALUE: Dict[Any, Union[int, str]] = {}
+# Axis argument (AxisName, 1-6 or name, without ALL) -> axis name used in GOLI/GOLA
+_AXIS_TO_NAME: Dict[Any, str] = {}
+for _number, _name in enumerate(_AXIS_NAMES, start=1):
+    # AxisName members are ints, so the number key also covers the member
+    for _key in (_number, _name, _name.lower()):
+        _AXIS_TO_NAME[_key] = _name
+        _AXIS_TO_VALUE[_key] = _name if isinstance(_key, str) else _number
+_AXIS_TO_VALUE.update({ALL_AXES: ALL_AXES, ALL_AXES.lower(): ALL_AXES})
+del _number, _name, _key
+
+# Pre-encoded axis names for GOLI/GOLA
+_AXIS_NAME_BYTES: Dict[str, bytes] = {name: name.encode() for name in _AXIS_NAMES}
+
+# Pre-encoded AXI command per axis value (as a string, e.g. "1" or "X")
+_AXI_COMMANDS: Dict[str, bytes] = {
+    str(value): f"AXI{value}".encode() for value in set(_AXIS_TO_VALUE.values())
+}
+
+# AXI axis value -> canonical axis key used by the selection caches, so that
+# selecting 1 after X (the same axis) is recognised as a no-op
+_AXIS_VALUE_TO_KEY: Dict[str, str] = {
+    str(value): _AXIS_TO_NAME.get(value, value) for value in set(_AXIS_TO_VALUE.values())
+}
+
+# Axis name -> its bit in the MOTIONA? response (X = bit 0 ... W = bit 5)
+_AXIS_MOTION_BITS: Dict[str, int] = {name: 1 << bit for bit, name in enumerate(_AXIS_NAMES)}
+
+# Drive mode argument (DriveMode, 0-6 or name) -> value used in the GO command
+_DRIVE_MODE_TO_VALUE: Dict[Any, int] = {
+    'CW': 0, 'CCW': 1, 'ORIGIN': 2, 'ORG': 2, 'HOME': 3,
+    'ABS': 4, 'CWJ': 5, 'CCWJ': 6,
+}
+_DRIVE_MODE_TO_VALUE.update({int(mode): int(mode) for mode in DriveMode})
+
+# Stop mode argument (StopMode, 0-1 or name) -> value used in the STOP command
+_STOP_MODE_TO_VALUE: Dict[Any, int] = {'EMERGENCY': 0, 'E': 0, 'REDUCTION': 1, 'R': 1}
+_STOP_MODE_TO_VALUE.update({int(mode): int(mode) for mode in StopMode})
+
+# Jog direction argument (Direction, 0-1 or name) -> jog drive mode
+_JOG_DIRECTION_TO_DRIVE_MODE: Dict[Any, DriveMode] = {
+    'CW': DriveMode.CWJ, 'CCW': DriveMode.CCWJ,
+    int(Direction.CW): DriveMode.CWJ, int(Direction.CCW): DriveMode.CCWJ,
+}
+
+# Unit argument (UnitType, 0-4 or name) -> value used in the UNIT command
+_UNIT_TO_VALUE: Dict[Any, int] = {'PULSE': 0, 'PULS': 0, 'UM': 1, 'MM': 2, 'DEG': 3, 'MRAD': 4}
+_UNIT_TO_VALUE.update({int(unit): int(unit) for unit in UnitType})
+
+# get_status keys and the AxisStatus bits they report, as plain ints
+_STATUS_FIELDS: Tuple[Tuple[str, int], ...] = tuple(
+    (key, int(flag)) for key, flag in (
+        ("program_driving", AxisStatus.PROGRAM_DRIVING),
+        ("in_motion", AxisStatus.IN_MOTION),
+        ("home_position_detected", AxisStatus.HOME_POSITION_DETECTED),
+        ("origin_detected", AxisStatus.ORIGIN_DETECTED),
+        ("discontinued", AxisStatus.DISCONTINUED),
+        ("soft_limit_detected", AxisStatus.SOFT_LIMIT_DETECTED),
+        ("mechanical_limit_detected", AxisStatus.MECHANICAL_LIMIT_DETECTED),
+        ("direction_cw", AxisStatus.DIRECTION_CW),
+        ("cw_mechanical_limit_detected", AxisStatus.CW_MECHANICAL_LIMIT_DETECTED),
+        ("ccw_mechanical_limit_detected", AxisStatus.CCW_MECHANICAL_LIMIT_DETECTED),
+        ("cw_soft_limit_detected", AxisStatus.CW_SOFT_LIMIT_DETECTED),
+        ("ccw_soft_limit_detected", AxisStatus.CCW_SOFT_LIMIT_DETECTED),
+        ("cw_soft_limit_enabled", AxisStatus.CW_SOFT_LIMIT_ENABLED),
+        ("ccw_soft_limit_enabled", AxisStatus.CCW_SOFT_LIMIT_ENABLED),
+        ("axis_selection_available", AxisStatus.AXIS_SELECTION_AVAILABLE),
+        ("micro_step_driver", AxisStatus.MICRO_STEP_DRIVER),  # Either driver bit
+    )
+)
+
+
+# Motion polling backs off from the min to the max interval (seconds), so short
+# moves are detected quickly without flooding the link during long ones
+_POLL_MIN_INTERVAL = 0.002
+_POLL_MAX_INTERVAL = 0.05
+
+# SETPRG commands sent per write by upload_program, to stay well within the
+# controller's receive buffer
+_PROGRAM_UPLOAD_BATCH = 10
+
+# set_speed_table arguments: (name, minimum, maximum), in argument order
+_SPEED_TABLE_RANGES = (
+    ("Speed table number", 0, 9),
+    ("Start-up speed", 1, 9999),
+    ("Drive speed", 1, 999999),
+    ("Acceleration and deceleration time", 1, 9999),
+    ("S-curve rate", 0, 100),
+)
+
+# Pre-encoded ":MEMSW<n> " command prefixes, indexed by switch number
+_MEMSW_COMMANDS = tuple(b":MEMSW%d " % switch for switch in range(8))
+
+# Pre-encoded I/O commands, indexed by input/output/port number
+_INPUT_QUERIES = tuple(b"IN%02d?" % number for number in range(48))
+_OUTPUT_ON_COMMANDS = tuple(b"OUT%02d_1" % number for number in range(36))
+_OUTPUT_OFF_COMMANDS = tuple(b"OUT%02d_0" % number for number in range(36))
+_INPUT_PORT_QUERIES = tuple(b"INP%d?" % number for number in range(3))
+_OUTPUT_PORT_QUERIES = tuple(b"OUTP%d?" % number for number in range(3))
+
+# Controller error codes -> description
+_ERROR_MESSAGES = MappingProxyType({
+    'E00': "Stage is not connected or sensor logic setting error",
+    'E01': "Axis is in motion",
+    'E02': "Limit detected",
+    'E03': "Emergency detected",
+    'E20': "Command rule error",
+    'E21': "Error of unsent delimiter",
+    'E22': "Setting range error",
+    'E40': "Communication error",
+    'E41': "Error of write in flash memory",
+})
+
+
 class MisumiXYWrapper:
     """
     A wrapper class for the Misumi DS102/DS112 Series Stepping Motor Controller.
     
     This class provides methods to control the Misumi XY stage via serial communication.
     It implements the communication protocol described in the DS102/DS112 Series Operation Manual.
+
+    Instances are not thread-safe and are meant to be driven from one thread.
+    The controller answers commands strictly in order with untagged responses,
+    and most commands act on the axis chosen by a preceding AXI, so commands
+    from concurrent callers could not be matched up or kept on the right axis
+    anyway. Batch commands with the pipelined methods to save round-trips, and
+    use AsyncMisumiXYWrapper to keep an event loop free while the stage works.
     """
 
+    __slots__ = (
+        'port', 'baudrate', 'timeout', 'serial', 'connected', 'delimiter',
+        '_delim_b', '_rx', '_selected_axis', '_accepted_axes', '_last_params',
+    )
+
     def __init__(self, port: str, baudrate: int = 38400, timeout: float = 1.0, auto_initialize: bool = False):
         """
         Initialize the MisumiXYWrapper.
@@ -115,26 +277,37 @@ class MisumiXYWrapper:
         self.serial = None
         self.connected = False
         self.delimiter = '\r'  # CR (Hex 0D)
+        self._delim_b = self.delimiter.encode()
+        self._rx = bytearray()  # Received bytes not yet consumed as a response
+        self._selected_axis: Optional[str] = None  # Last axis selected on the controller
+        self._accepted_axes: set = set()  # Axes the controller has accepted an AXI command for
+        self._last_params: Dict[Tuple, Any] = {}  # Last value written per (parameter, axis)
         self.connect()
         if auto_initialize:
             self.initialize()
     
     def initialize(self):
-        self.set_memory_switch_0(1,3)
-        self.set_memory_switch_0(2,3)
-        self.select_speed(1,8)
-        self.select_speed(2,8)
-        self.drive(1,2)
-        self.drive(2,2)
-
-        while(self.is_in_motion(1) or self.is_in_motion(2)):
-            pass
+        # The raw commands below bypass the parameter cache
+        self._last_params.clear()
+        # Origin return type 3 and speed table 8 on both axes. The settings
+        # are sent before the drives so a rejected setting stops the sequence
+        # before anything moves.
+        self._send_commands_pipelined([
+            "AXI1", ":MEMSW0 3", ":SELSP 8",
+            "AXI2", ":MEMSW0 3", ":SELSP 8",
+        ])
+        # Origin return on both axes
+        self._send_commands_pipelined(["AXI1", ":GO 2", "AXI2", ":GO 2"])
 
-        self.set_position(1,0)
-        self.set_position(2,0)
+        # Poll at ~20 Hz instead of spinning; homing takes seconds anyway
+        while any(self.are_axes_in_motion((1, 2)).values()):
+            time.sleep(0.05)
 
-        self.set_home_position(1,0)
-        self.set_home_position(2,0)
+        # Zero the current and home positions
+        self._send_commands_pipelined([
+            "AXI1", ":POS 0", ":HOMEP 0",
+            "AXI2", ":POS 0", ":HOMEP 0",
+        ])
 
     def connect(self) -> bool:
         """
@@ -152,14 +325,36 @@ class MisumiXYWrapper:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout
             )
+            self._enable_low_latency()
+            # Drop anything left over from a previous session (also forgets the axis selection)
+            self._resync()
+            self._accepted_axes.clear()
+            self._last_params.clear()
             self.connected = True
-            logger.info(f"Connected to {self.port} at {self.baudrate} baud")
+            logger.info("Connected to %s at %s baud", self.port, self.baudrate)
             return True
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             self.connected = False
             return False
     
+    def _enable_low_latency(self) -> None:
+        """
+        Ask the USB-serial driver to pass received bytes on immediately.
+        
+        FTDI adapters otherwise hold short responses for their latency timer
+        (16 ms by default), which adds to every command round-trip. This is
+        only available on Linux (ASYNC_LOW_LATENCY); elsewhere it is a no-op.
+        """
+        if not hasattr(self.serial, "set_low_latency_mode"):
+            return
+        try:
+            self.serial.set_low_latency_mode(True)
+        except (OSError, ValueError, NotImplementedError) as e:
+            # Not every driver or platform supports the flag (pyserial raises
+            # NotImplementedError outside Linux); the port still works without it
+            logger.debug("Low latency mode not available: %s", e)
+    
     def disconnect(self) -> bool:
         """
         Disconnect from the controller.
@@ -171,19 +366,20 @@ class MisumiXYWrapper:
             try:
                 self.serial.close()
                 self.connected = False
+                self._selected_axis = None
                 logger.info("Disconnected from controller")
                 return True
             except Exception as e:
-                logger.error(f"Failed to disconnect: {e}")
+                logger.error("Failed to disconnect: %s", e)
                 return False
         return True
     
-    def _send_command(self, command: str) -> str:
+    def _send_command(self, command: Union[str, bytes]) -> str:
         """
         Send a command to the controller and return the response.
         
         Args:
-            command (str): Command to send
+            command (Union[str, bytes]): Command to send (bytes are written without re-encoding)
             
         Returns:
             str: Response from the controller
@@ -196,47 +392,201 @@ class MisumiXYWrapper:
         if not self.connected or not self.serial:
             raise ConnectionError("Not connected to controller")
         
+        if isinstance(command, str):
+            command = command.encode()
         # Add delimiter if not present
-        if not command.endswith(self.delimiter):
-            command += self.delimiter
+        if not command.endswith(self._delim_b):
+            command += self._delim_b
         
         try:
-            # Clear input buffer
-            self.serial.reset_input_buffer()
-            
             # Send command
-            logger.debug(f"Sending command: {command.strip()}")
-            self.serial.write(command.encode())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command: %s", command.decode().strip())
+            self.serial.write(command)
             
             # Read response
-            response = self.serial.read_until(self.delimiter.encode()).decode().strip()
-            logger.debug(f"Received response: {response}")
+            response = self._read_response()
+            logger.debug("Received response: %s", response)
             
             # Check for error responses
-            if response.startswith('E'):
-                error_code = response
-                error_messages = {
-                    'E00': "Stage is not connected or sensor logic setting error",
-                    'E01': "Axis is in motion",
-                    'E02': "Limit detected",
-                    'E03': "Emergency detected",
-                    'E20': "Command rule error",
-                    'E21': "Error of unsent delimiter",
-                    'E22': "Setting range error",
-                    'E40': "Communication error",
-                    'E41': "Error of write in flash memory"
-                }
-                error_msg = error_messages.get(error_code, f"Unknown error: {error_code}")
-                raise ValueError(f"Controller error: {error_msg}")
+            self._check_response(response)
             
             return response
         
         except serial.SerialTimeoutException:
             raise TimeoutError("Timeout waiting for response from controller")
         except Exception as e:
-            logger.error(f"Communication error: {e}")
+            logger.error("Communication error: %s", e)
             raise
     
+    def _send_commands_pipelined(self, commands: List[Union[str, bytes]]) -> List[str]:
+        """
+        Send several commands in a single write and return their responses.
+        
+        The controller answers every command with one delimited response, so
+        writing the commands back-to-back and then reading the responses costs
+        one serial round-trip instead of one per command.
+        
+        Args:
+            commands (List[Union[str, bytes]]): Commands to send, in order
+            
+        Returns:
+            List[str]: Responses from the controller, in command order
+        
+        Raises:
+            ConnectionError: If not connected to the controller
+            TimeoutError: If no response is received within timeout
+            ValueError: If any response indicates an error (raised after all
+                responses have been read, so the link stays in sync)
+        """
+        if not self.connected or not self.serial:
+            raise ConnectionError("Not connected to controller")
+        
+        commands = [command.encode() if isinstance(command, str) else command for command in commands]
+        payload = b''.join(
+            command if command.endswith(self._delim_b) else command + self._delim_b
+            for command in commands
+        )
+        
+        try:
+            # Send all commands at once
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending commands: %s", ' | '.join(command.decode().strip() for command in commands))
+            self.serial.write(payload)
+            
+            # Read one response per command
+            responses = [self._read_response() for _ in commands]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received responses: %s", ' | '.join(responses))
+            
+            # Keep the axis selection cache in step with any AXI commands in the batch
+            axis_commands = [command.strip() for command in commands if command.startswith(b"AXI")]
+            if axis_commands:
+                if any(response[:1] == 'E' for response in responses):
+                    self._selected_axis = None
+                else:
+                    axis_keys = [_AXIS_VALUE_TO_KEY.get(command[3:].decode()) for command in axis_commands]
+                    self._accepted_axes.update(axis_keys)
+                    self._selected_axis = axis_keys[-1]
+            
+            # Check for error responses
+            for response in responses:
+                self._check_response(response)
+            
+            return responses
+        
+        except serial.SerialTimeoutException:
+            raise TimeoutError("Timeout waiting for response from controller")
+        except Exception as e:
+            logger.error("Communication error: %s", e)
+            raise
+    
+    def _read_response(self) -> str:
+        """
+        Read one delimited response from the controller.
+        
+        Returns:
+            str: Response with the delimiter and surrounding whitespace removed
+        
+        Raises:
+            TimeoutError: If no complete response is received within timeout
+            ValueError: If the response cannot be decoded
+        """
+        # serial.read_until() reads one byte per call; instead read whatever is
+        # waiting (at least one byte) and split responses out of our own buffer
+        end = self._rx.find(self._delim_b)
+        while end < 0:
+            chunk = self.serial.read(self.serial.in_waiting or 1)
+            if not chunk:
+                # A late response would be mistaken for the answer to the next command
+                self._resync()
+                raise TimeoutError("Timeout waiting for response from controller")
+            self._rx += chunk
+            end = self._rx.find(self._delim_b)
+        
+        raw = bytes(self._rx[:end])
+        del self._rx[:end + len(self._delim_b)]
+        try:
+            return raw.decode().strip()
+        except UnicodeDecodeError:
+            self._resync()
+            raise ValueError(f"Malformed response from controller: {raw!r}")
+    
+    def _resync(self) -> None:
+        """
+        Discard pending input so the next response lines up with the next command.
+        
+        The input buffer is only flushed here (on connect and after a timeout or
+        malformed response) rather than before every command. The cached axis
+        selection is forgotten too, since it is unknown whether the lost command
+        reached the controller.
+        """
+        self.serial.reset_input_buffer()
+        self._rx.clear()
+        self._selected_axis = None
+    
+    def _wait_until_ready(self, timeout: float, interval: float = _POLL_MIN_INTERVAL) -> bool:
+        """
+        Wait until the controller answers a status query again.
+        
+        Used after commands that keep the controller busy for a while (flash
+        write, parameter reset) instead of sleeping for the worst case. The
+        query is answered as soon as the controller has finished; error
+        responses (busy) are retried with a delay that backs off from interval
+        to _POLL_MAX_INTERVAL.
+        
+        Args:
+            timeout (float): Maximum time to wait in seconds
+            interval (float, optional): Initial delay between retries after an error response. Defaults to _POLL_MIN_INTERVAL.
+            
+        Returns:
+            bool: True if the controller is ready, False if the timeout expired
+        """
+        deadline = time.monotonic() + timeout
+        delay = interval
+        port_timeout = self.serial.timeout
+        try:
+            while True:
+                # Block for the answer rather than re-sending: a query that timed
+                # out could still be answered later and desync the link
+                self.serial.timeout = max(deadline - time.monotonic(), delay)
+                self.serial.write(b"*IDN?" + self._delim_b)
+                try:
+                    response = self._read_response()
+                except TimeoutError:
+                    # The query is still outstanding; give a late answer the usual
+                    # port timeout and drop it, so it is not taken as the response
+                    # to the next command (a second timeout resyncs the link)
+                    self.serial.timeout = port_timeout
+                    try:
+                        self._read_response()
+                    except TimeoutError:
+                        pass
+                    return False
+                if response[:1] != 'E':
+                    return True
+                if time.monotonic() + delay >= deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 1.5, _POLL_MAX_INTERVAL)
+        finally:
+            self.serial.timeout = port_timeout
+    
+    def _check_response(self, response: str) -> None:
+        """
+        Raise an error if the response is a controller error code.
+        
+        Args:
+            response (str): Response from the controller
+        
+        Raises:
+            ValueError: If the response indicates an error
+        """
+        if response[:1] == 'E':
+            error_code = response
+            error_msg = _ERROR_MESSAGES.get(error_code, f"Unknown error: {error_code}")
+            raise ValueError(f"Controller error: {error_msg}")
+    
     def _format_value(self, value: Union[int, float]) -> str:
         """
         Format a value for sending to the controller.
@@ -247,13 +597,10 @@ class MisumiXYWrapper:
         Returns:
             str: Formatted value
         """
-        if isinstance(value, int):
-            return str(value)
-        elif isinstance(value, float):
-            # Remove trailing zeros after decimal point
-            return str(value).rstrip('0').rstrip('.') if '.' in str(value) else str(value)
-        else:
-            return str(value)
+        if isinstance(value, float):
+            # Whole numbers without the trailing ".0"; otherwise the shortest exact repr
+            return str(int(value)) if value.is_integer() else repr(value)
+        return str(value)
     
     # -------------------------------------------------------------------------
     # Axis Selection and Parameter Setting Commands
@@ -263,19 +610,80 @@ class MisumiXYWrapper:
         """
         Select an axis for subsequent commands.
         
+        The AXI command is skipped if the axis is already selected.
+        
         Args:
             axis (Union[AxisName, int, str]): Axis to select (1-6 or X, Y, Z, U, V, W or ALL)
         """
-        if isinstance(axis, AxisName):
-            axis_value = axis.value
-        elif isinstance(axis, int) and 1 <= axis <= 6:
-            axis_value = axis
-        elif isinstance(axis, str) and axis.upper() in ['X', 'Y', 'Z', 'U', 'V', 'W', 'ALL']:
-            axis_value = axis.upper()
-        else:
-            raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W or ALL")
+        axis_value = str(self._resolve_axis(axis))
+        axis_key = _AXIS_VALUE_TO_KEY[axis_value]
+        if axis_key == self._selected_axis:
+            return
+        self._send_command(_AXI_COMMANDS[axis_value])
+        self._selected_axis = axis_key
+        self._accepted_axes.add(axis_key)
+    
+    def _send_axis_command(self, axis: Union[AxisName, int, str], command: bytes) -> str:
+        """
+        Send a query to the specified axis and return the response.
         
-        self._send_command(f"AXI{axis_value}")
+        See _send_axis_commands.
+        """
+        return self._send_axis_commands(axis, [command])[0]
+    
+    def _send_axis_commands(self, axis: Union[AxisName, int, str], commands: List[bytes]) -> List[str]:
+        """
+        Send queries to the specified axis in a single write and return their responses.
+        
+        The controller has no single-line form combining axis selection with a
+        command, so if the axis is not already selected the AXI command is sent
+        in the same write as the queries. Only use this for queries: if AXI is
+        rejected the queries still run against the previously selected axis,
+        which is harmless for a read (the error is raised) but not for a move.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis to query
+            commands (List[bytes]): Queries to send, in order
+            
+        Returns:
+            List[str]: Responses to the queries, in command order
+        """
+        axis_value = str(self._resolve_axis(axis))
+        if _AXIS_VALUE_TO_KEY[axis_value] == self._selected_axis:
+            if len(commands) == 1:
+                return [self._send_command(commands[0])]
+            return self._send_commands_pipelined(commands)
+        return self._send_commands_pipelined([_AXI_COMMANDS[axis_value], *commands])[1:]
+    
+    def _resolve_axis(self, axis: Union[AxisName, int, str]) -> Union[int, str]:
+        """
+        Convert an axis argument to the value used in the AXI command.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis (1-6 or X, Y, Z, U, V, W or ALL)
+            
+        Returns:
+            Union[int, str]: Axis number (1-6) or axis name
+        """
+        try:
+            return _AXIS_TO_VALUE[axis.upper() if isinstance(axis, str) else axis]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W or ALL") from None
+    
+    def _resolve_axis_name(self, axis: Union[AxisName, int, str]) -> str:
+        """
+        Convert an axis argument to its axis name.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis (1-6 or X, Y, Z, U, V, W)
+            
+        Returns:
+            str: Axis name (X, Y, Z, U, V or W)
+        """
+        try:
+            return _AXIS_TO_NAME[axis.upper() if isinstance(axis, str) else axis]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W") from None
     
     def set_cw_soft_limit(self, axis: Union[AxisName, int, str], enable: bool, position: Optional[float] = None) -> None:
         """
@@ -286,11 +694,7 @@ class MisumiXYWrapper:
             enable (bool): Enable or disable soft limit
             position (Optional[float]): Position of soft limit (if enable is True)
         """
-        self.select_axis(axis)
-        self._send_command(f":CWSLE {1 if enable else 0}")
-        
-        if enable and position is not None:
-            self._send_command(f":CWSLP {self._format_value(position)}")
+        self._set_soft_limit(axis, b":CWSLE ", b":CWSLP ", enable, position)
     
     def set_ccw_soft_limit(self, axis: Union[AxisName, int, str], enable: bool, position: Optional[float] = None) -> None:
         """
@@ -301,11 +705,68 @@ class MisumiXYWrapper:
             enable (bool): Enable or disable soft limit
             position (Optional[float]): Position of soft limit (if enable is True)
         """
-        self.select_axis(axis)
-        self._send_command(f":CCWSLE {1 if enable else 0}")
+        self._set_soft_limit(axis, b":CCWSLE ", b":CCWSLP ", enable, position)
+    
+    def _set_soft_limit(self, axis: Union[AxisName, int, str], enable_command: bytes, position_command: bytes,
+                        enable: bool, position: Optional[float]) -> None:
+        """
+        Send a soft limit enable command and, if given, its position.
+        
+        The commands are sent one at a time rather than pipelined, so that the
+        position is not written if the controller rejects the enable command.
         
+        Args:
+            axis (Union[AxisName, int, str]): Axis to set
+            enable_command (bytes): Enable command prefix (e.g. b":CWSLE ")
+            position_command (bytes): Position command prefix (e.g. b":CWSLP ")
+            enable (bool): Enable or disable soft limit
+            position (Optional[float]): Position of soft limit (if enable is True)
+        """
+        commands = [enable_command + (b"1" if enable else b"0")]
         if enable and position is not None:
-            self._send_command(f":CCWSLP {self._format_value(position)}")
+            commands.append(position_command + self._format_value(position).encode())
+        
+        axis_name = _AXIS_TO_NAME.get(axis.upper() if isinstance(axis, str) else axis)
+        if axis_name is not None and self._last_params.get((enable_command, axis_name)) == commands:
+            return
+        
+        self.select_axis(axis)
+        for command in commands:
+            # Raises on an error response before the next command is sent
+            self._send_command(command)
+        self._remember_parameter(enable_command, axis_name, commands)
+    
+    def _set_parameter(self, axis: Union[AxisName, int, str], command: bytes, value: bytes) -> None:
+        """
+        Set an axis parameter, skipping the write if the same value was last written.
+        
+        Only use this for idempotent parameters; the cache assumes this wrapper is
+        the only one changing them while connected.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis to set
+            command (bytes): Command prefix (e.g. b":UNIT ")
+            value (bytes): Encoded parameter value
+        """
+        axis_name = _AXIS_TO_NAME.get(axis.upper() if isinstance(axis, str) else axis)
+        if axis_name is not None and self._last_params.get((command, axis_name)) == value:
+            return
+        
+        self.select_axis(axis)
+        self._send_command(command + value)
+        self._remember_parameter(command, axis_name, value)
+    
+    def _remember_parameter(self, command: bytes, axis_name: Optional[str], value: Any) -> None:
+        """
+        Record a parameter value written to one axis, or to all axes if axis_name is None.
+        
+        Args:
+            command (bytes): Command prefix identifying the parameter
+            axis_name (Optional[str]): Axis name (X-W), or None for ALL
+            value (Any): Value written
+        """
+        for name in (_AXIS_NAMES if axis_name is None else (axis_name,)):
+            self._last_params[(command, name)] = value
     
     def set_driver_division(self, axis: Union[AxisName, int, str], division: int) -> None:
         """
@@ -334,8 +795,7 @@ class MisumiXYWrapper:
         if not 0 <= division <= 15:
             raise ValueError("Division must be between 0 and 15")
         
-        self.select_axis(axis)
-        self._send_command(f":DRDIV {division}")
+        self._set_parameter(axis, b":DRDIV ", b"%d" % division)
     
     def set_data_selection(self, axis: Union[AxisName, int, str], data_selection: int) -> None:
         """
@@ -350,8 +810,7 @@ class MisumiXYWrapper:
         if data_selection not in [1, 2]:
             raise ValueError("Data selection must be 1 or 2")
         
-        self.select_axis(axis)
-        self._send_command(f":DATA {data_selection}")
+        self._set_parameter(axis, b":DATA ", b"%d" % data_selection)
     
     def set_home_position(self, axis: Union[AxisName, int, str], position: float) -> None:
         """
@@ -361,8 +820,7 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to set
             position (float): Home position
         """
-        self.select_axis(axis)
-        self._send_command(f":HOMEP {self._format_value(position)}")
+        self._set_parameter(axis, b":HOMEP ", self._format_value(position).encode())
     
     def set_position(self, axis: Union[AxisName, int, str], position: float) -> None:
         """
@@ -373,7 +831,7 @@ class MisumiXYWrapper:
             position (float): Current position
         """
         self.select_axis(axis)
-        self._send_command(f":POS {self._format_value(position)}")
+        self._send_command(b":POS " + self._format_value(position).encode())
     
     def set_pulse(self, axis: Union[AxisName, int, str], pulse: float) -> None:
         """
@@ -383,8 +841,10 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to set
             pulse (float): Pulse distance
         """
+        # Always sent: this is the step for the next drive, not a setting the
+        # parameter cache can assume is still in place
         self.select_axis(axis)
-        self._send_command(f":PULS {self._format_value(pulse)}")
+        self._send_command(b":PULS " + self._format_value(pulse).encode())
     
     def set_pulse_absolute(self, axis: Union[AxisName, int, str], position: float) -> None:
         """
@@ -394,8 +854,10 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to set
             position (float): Absolute position
         """
+        # Always sent: GOABS/GOLA also set the ABS drive target, so a cached
+        # value could be stale
         self.select_axis(axis)
-        self._send_command(f":PULSA {self._format_value(position)}")
+        self._send_command(b":PULSA " + self._format_value(position).encode())
     
     def select_speed(self, axis: Union[AxisName, int, str], speed_table: int) -> None:
         """
@@ -408,8 +870,7 @@ class MisumiXYWrapper:
         if not 0 <= speed_table <= 9:
             raise ValueError("Speed table must be between 0 and 9")
         
-        self.select_axis(axis)
-        self._send_command(f":SELSP {speed_table}")
+        self._set_parameter(axis, b":SELSP ", b"%d" % speed_table)
     
     def set_standard_resolution(self, axis: Union[AxisName, int, str], resolution: float) -> None:
         """
@@ -419,8 +880,7 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to set
             resolution (float): Standard resolution
         """
-        self.select_axis(axis)
-        self._send_command(f":STANDARD {self._format_value(resolution)}")
+        self._set_parameter(axis, b":STANDARD ", self._format_value(resolution).encode())
     
     def set_unit(self, axis: Union[AxisName, int, str], unit: Union[UnitType, int, str]) -> None:
         """
@@ -435,18 +895,11 @@ class MisumiXYWrapper:
                 3 or DEG: deg
                 4 or MRAD: mrad
         """
-        if isinstance(unit, UnitType):
-            unit_value = unit.value
-        elif isinstance(unit, int) and 0 <= unit <= 4:
-            unit_value = unit
-        elif isinstance(unit, str) and unit.upper() in ['PULSE', 'PULS', 'UM', 'MM', 'DEG', 'MRAD']:
-            unit_map = {'PULSE': 0, 'PULS': 0, 'UM': 1, 'MM': 2, 'DEG': 3, 'MRAD': 4}
-            unit_value = unit_map[unit.upper()]
-        else:
+        unit_value = _UNIT_TO_VALUE.get(unit.upper() if isinstance(unit, str) else unit)
+        if unit_value is None:
             raise ValueError("Invalid unit. Must be 0-4 or PULSE, UM, MM, DEG, MRAD")
         
-        self.select_axis(axis)
-        self._send_command(f":UNIT {unit_value}")
+        self._set_parameter(axis, b":UNIT ", b"%d" % unit_value)
     
     def set_teaching_point(self, point_number: int, positions: Dict[Union[AxisName, int, str], Union[float, str]]) -> None:
         """
@@ -466,14 +919,7 @@ class MisumiXYWrapper:
         
         # Update position values based on provided positions
         for axis, position in positions.items():
-            if isinstance(axis, AxisName):
-                axis_index = axis.value - 1  # Convert to 0-based index
-            elif isinstance(axis, int) and 1 <= axis <= 6:
-                axis_index = axis - 1
-            elif isinstance(axis, str) and axis.upper() in ['X', 'Y', 'Z', 'U', 'V', 'W']:
-                axis_index = {'X': 0, 'Y': 1, 'Z': 2, 'U': 3, 'V': 4, 'W': 5}[axis.upper()]
-            else:
-                raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W")
+            axis_index = _AXIS_NAMES.index(self._resolve_axis_name(axis))
             
             if position == 'N' or position == 'S':
                 axis_values[axis_index] = position
@@ -488,6 +934,17 @@ class MisumiXYWrapper:
     # Memory Switch Setting Commands
     # -------------------------------------------------------------------------
     
+    def _set_memory_switch(self, axis: Union[AxisName, int, str], switch: int, value: int) -> None:
+        """
+        Set a memory switch for the specified axis.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis to set
+            switch (int): Memory switch number (0-7)
+            value (int): Validated switch value
+        """
+        self._set_parameter(axis, _MEMSW_COMMANDS[switch], b"%d" % value)
+    
     def set_memory_switch_0(self, axis: Union[AxisName, int, str], origin_type: Union[OriginReturnType, int]) -> None:
         """
         Set memory switch 0 (origin return type) for the specified axis.
@@ -496,15 +953,10 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to set
             origin_type (Union[OriginReturnType, int]): Origin return type (0-12)
         """
-        if isinstance(origin_type, OriginReturnType):
-            type_value = origin_type.value
-        elif isinstance(origin_type, int) and 0 <= origin_type <= 12:
-            type_value = origin_type
-        else:
+        if not (isinstance(origin_type, int) and 0 <= origin_type <= 12):
             raise ValueError("Origin return type must be between 0 and 12")
         
-        self.select_axis(axis)
-        self._send_command(f":MEMSW0 {type_value}")
+        self._set_memory_switch(axis, 0, origin_type)
     
     def set_memory_switch_1(self, axis: Union[AxisName, int, str], limit_logic: Union[SensorLogic, int]) -> None:
         """
@@ -516,15 +968,10 @@ class MisumiXYWrapper:
                 0: B point (Normal Close)
                 1: A point (Normal Open)
         """
-        if isinstance(limit_logic, SensorLogic):
-            logic_value = limit_logic.value
-        elif isinstance(limit_logic, int) and limit_logic in [0, 1]:
-            logic_value = limit_logic
-        else:
+        if not (isinstance(limit_logic, int) and limit_logic in [0, 1]):
             raise ValueError("Limit sensor logic must be 0 or 1")
         
-        self.select_axis(axis)
-        self._send_command(f":MEMSW1 {logic_value}")
+        self._set_memory_switch(axis, 1, limit_logic)
     
     def set_memory_switch_2(self, axis: Union[AxisName, int, str], origin_logic: Union[SensorLogic, int]) -> None:
         """
@@ -536,15 +983,10 @@ class MisumiXYWrapper:
                 0: B point (Normal Close)
                 1: A point (Normal Open)
         """
-        if isinstance(origin_logic, SensorLogic):
-            logic_value = origin_logic.value
-        elif isinstance(origin_logic, int) and origin_logic in [0, 1]:
-            logic_value = origin_logic
-        else:
+        if not (isinstance(origin_logic, int) and origin_logic in [0, 1]):
             raise ValueError("Origin sensor logic must be 0 or 1")
         
-        self.select_axis(axis)
-        self._send_command(f":MEMSW2 {logic_value}")
+        self._set_memory_switch(axis, 2, origin_logic)
     
     def set_memory_switch_3(self, axis: Union[AxisName, int, str], near_origin_logic: Union[SensorLogic, int]) -> None:
         """
@@ -556,15 +998,10 @@ class MisumiXYWrapper:
                 0: B point (Normal Close)
                 1: A point (Normal Open)
         """
-        if isinstance(near_origin_logic, SensorLogic):
-            logic_value = near_origin_logic.value
-        elif isinstance(near_origin_logic, int) and near_origin_logic in [0, 1]:
-            logic_value = near_origin_logic
-        else:
+        if not (isinstance(near_origin_logic, int) and near_origin_logic in [0, 1]):
             raise ValueError("Near origin sensor logic must be 0 or 1")
         
-        self.select_axis(axis)
-        self._send_command(f":MEMSW3 {logic_value}")
+        self._set_memory_switch(axis, 3, near_origin_logic)
     
     def set_memory_switch_4(self, axis: Union[AxisName, int, str], current_down: bool) -> None:
         """
@@ -576,8 +1013,7 @@ class MisumiXYWrapper:
                 True: Control current down
                 False: No current down control (only for MS type)
         """
-        self.select_axis(axis)
-        self._send_command(f":MEMSW4 {0 if current_down else 1}")
+        self._set_memory_switch(axis, 4, 0 if current_down else 1)
     
     def set_memory_switch_5(self, axis: Union[AxisName, int, str], direction: bool) -> None:
         """
@@ -589,8 +1025,7 @@ class MisumiXYWrapper:
                 True: Normal direction (POSITIVE)
                 False: Reversed direction (NEGATIVE)
         """
-        self.select_axis(axis)
-        self._send_command(f":MEMSW5 {0 if direction else 1}")
+        self._set_memory_switch(axis, 5, 0 if direction else 1)
     
     def set_memory_switch_6(self, axis: Union[AxisName, int, str], stop_type: bool) -> None:
         """
@@ -602,8 +1037,7 @@ class MisumiXYWrapper:
                 True: Fast stop
                 False: Slowdown stop
         """
-        self.select_axis(axis)
-        self._send_command(f":MEMSW6 {0 if stop_type else 1}")
+        self._set_memory_switch(axis, 6, 0 if stop_type else 1)
     
     def set_memory_switch_7(self, axis: Union[AxisName, int, str], zero_reset: bool) -> None:
         """
@@ -615,8 +1049,7 @@ class MisumiXYWrapper:
                 True: Reset to 0 after origin return
                 False: No reset after origin return
         """
-        self.select_axis(axis)
-        self._send_command(f":MEMSW7 {0 if zero_reset else 1}")
+        self._set_memory_switch(axis, 7, 0 if zero_reset else 1)
     
     # -------------------------------------------------------------------------
     # Speed Table Setting Commands
@@ -634,21 +1067,22 @@ class MisumiXYWrapper:
             accel_decel_time (int): Acceleration and deceleration time (1-9999 msec)
             s_rate (int, optional): S-curve rate (0-100 %). Defaults to 0.
         """
-        if not 0 <= table_number <= 9:
-            raise ValueError("Speed table number must be between 0 and 9")
-        if not 1 <= start_speed <= 9999:
-            raise ValueError("Start-up speed must be between 1 and 9999")
-        if not 1 <= drive_speed <= 999999:
-            raise ValueError("Drive speed must be between 1 and 999999")
-        if not 1 <= accel_decel_time <= 9999:
-            raise ValueError("Acceleration and deceleration time must be between 1 and 9999")
-        if not 0 <= s_rate <= 100:
-            raise ValueError("S-curve rate must be between 0 and 100")
-        
-        self._send_command(f":L{table_number} {start_speed}")
-        self._send_command(f":F{table_number} {drive_speed}")
-        self._send_command(f":R{table_number} {accel_decel_time}")
-        self._send_command(f":S{table_number} {s_rate}")
+        values = (start_speed, drive_speed, accel_decel_time, s_rate)
+        for value, (name, low, high) in zip((table_number,) + values, _SPEED_TABLE_RANGES):
+            if not low <= value <= high:
+                raise ValueError(f"{name} must be between {low} and {high}")
+        
+        key = ("SPEED", table_number)
+        if self._last_params.get(key) == values:
+            return
+        
+        self._send_commands_pipelined([
+            f":L{table_number} {start_speed}",
+            f":F{table_number} {drive_speed}",
+            f":R{table_number} {accel_decel_time}",
+            f":S{table_number} {s_rate}",
+        ])
+        self._last_params[key] = values
     
     # -------------------------------------------------------------------------
     # Write and Reset Commands
@@ -662,7 +1096,8 @@ class MisumiXYWrapper:
         """
         self._send_command("WRITE")
         # Wait for the write operation to complete
-        time.sleep(0.2)
+        if not self._wait_until_ready(0.2):
+            logger.warning("Controller not ready after writing to flash memory")
     
     def reset_all_parameters(self) -> None:
         """
@@ -671,8 +1106,11 @@ class MisumiXYWrapper:
         Note: Do not power off for over 5 seconds after sending this command.
         """
         self._send_command("*RST")
+        self._selected_axis = None
+        self._last_params.clear()
         # Wait for the reset operation to complete
-        time.sleep(5.5)
+        if not self._wait_until_ready(6.0):
+            logger.warning("Controller not ready after parameter reset")
     
     # -------------------------------------------------------------------------
     # Driving Commands
@@ -693,24 +1131,12 @@ class MisumiXYWrapper:
                 5 or CWJ: Jog drive in CW direction
                 6 or CCWJ: Jog drive in CCW direction
         """
-        if isinstance(mode, DriveMode):
-            mode_value = mode.value
-        elif isinstance(mode, int) and 0 <= mode <= 6:
-            mode_value = mode
-        elif isinstance(mode, str):
-            mode_map = {
-                'CW': 0, 'CCW': 1, 'ORIGIN': 2, 'ORG': 2, 'HOME': 3, 
-                'ABS': 4, 'CWJ': 5, 'CCWJ': 6
-            }
-            if mode.upper() in mode_map:
-                mode_value = mode_map[mode.upper()]
-            else:
-                raise ValueError("Invalid drive mode")
-        else:
+        mode_value = _DRIVE_MODE_TO_VALUE.get(mode.upper() if isinstance(mode, str) else mode)
+        if mode_value is None:
             raise ValueError("Invalid drive mode")
         
         self.select_axis(axis)
-        self._send_command(f":GO {mode_value}")
+        self._send_command(b":GO %d" % mode_value)
     
     def drive_absolute(self, axis: Union[AxisName, int, str], position: float) -> None:
         """
@@ -720,9 +1146,21 @@ class MisumiXYWrapper:
             axis (Union[AxisName, int, str]): Axis to drive
             position (float): Absolute position
         """
-        self.select_axis(axis)
-        logger.info(f"Driving axis {axis} to absolute position {position}")
-        self._send_command(f":GOABS {self._format_value(position)}")
+        axis_value = str(self._resolve_axis(axis))
+        axis_key = _AXIS_VALUE_TO_KEY[axis_value]
+        logger.info("Driving axis %s to absolute position %s", axis, position)
+        command = b":GOABS " + self._format_value(position).encode()
+        
+        if axis_key == self._selected_axis:
+            self._send_command(command)
+        elif axis_key in self._accepted_axes:
+            # Select the axis and start the move in a single write. Only done for
+            # axes the controller has accepted before: in a pipelined batch a
+            # rejected AXI would let GOABS move the previously selected axis.
+            self._send_commands_pipelined([_AXI_COMMANDS[axis_value], command])
+        else:
+            self.select_axis(axis)
+            self._send_command(command)
     
     def drive_to_teaching_point(self, point_number: int) -> None:
         """
@@ -745,21 +1183,13 @@ class MisumiXYWrapper:
                 Key: Axis (X, Y, Z, U, V, W)
                 Value: Direction (True for CW/+, False for CCW/-)
         """
-        command = "GOLI "
+        parts = [b"GOLI "]
         
         for axis, direction in axis_directions.items():
-            if isinstance(axis, AxisName):
-                axis_name = axis.name
-            elif isinstance(axis, int) and 1 <= axis <= 6:
-                axis_name = ['X', 'Y', 'Z', 'U', 'V', 'W'][axis - 1]
-            elif isinstance(axis, str) and axis.upper() in ['X', 'Y', 'Z', 'U', 'V', 'W']:
-                axis_name = axis.upper()
-            else:
-                raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W")
-            
-            command += f"{axis_name}{'+' if direction else '-'}"
+            parts.append(_AXIS_NAME_BYTES[self._resolve_axis_name(axis)])
+            parts.append(b"+" if direction else b"-")
         
-        self._send_command(command)
+        self._send_command(b"".join(parts))
     
     def drive_linear_absolute(self, axis_positions: Dict[Union[AxisName, int, str], float]) -> None:
         """
@@ -770,25 +1200,13 @@ class MisumiXYWrapper:
                 Key: Axis (X, Y, Z, U, V, W)
                 Value: Absolute position
         """
-        command = "GOLA "
+        # Axis/position pairs separated by underscores, e.g. GOLA X100_Y200
+        command = b"GOLA " + b"_".join(
+            _AXIS_NAME_BYTES[self._resolve_axis_name(axis)] + self._format_value(position).encode()
+            for axis, position in axis_positions.items()
+        )
 
-        for axis, position in axis_positions.items():
-            if isinstance(axis, AxisName):
-                axis_name = axis.name
-            elif isinstance(axis, int) and 1 <= axis <= 6:
-                axis_name = ['X', 'Y', 'Z', 'U', 'V', 'W'][axis - 1]
-            elif isinstance(axis, str) and axis.upper() in ['X', 'Y', 'Z', 'U', 'V', 'W']:
-                axis_name = axis.upper()
-            else:
-                raise ValueError("Invalid axis. Must be 1-6 or X, Y, Z, U, V, W")
-
-            command += f"{axis_name}{self._format_value(position)}_"
-
-        # Remove trailing underscore
-        if command.endswith('_'):
-            command = command[:-1]
-
-        logger.info(f"Linear absolute command: {command}")
+        logger.info("Linear absolute command: %s", command.decode())
         self._send_command(command)
     
     def stop(self, axis: Optional[Union[AxisName, int, str]] = None, mode: Union[StopMode, int, str] = StopMode.EMERGENCY) -> None:
@@ -801,26 +1219,17 @@ class MisumiXYWrapper:
                 0 or EMERGENCY: Emergency stop
                 1 or REDUCTION: Slowdown stop
         """
-        if isinstance(mode, StopMode):
-            mode_value = mode.value
-        elif isinstance(mode, int) and mode in [0, 1]:
-            mode_value = mode
-        elif isinstance(mode, str):
-            mode_map = {'EMERGENCY': 0, 'E': 0, 'REDUCTION': 1, 'R': 1}
-            if mode.upper() in mode_map:
-                mode_value = mode_map[mode.upper()]
-            else:
-                raise ValueError("Invalid stop mode")
-        else:
+        mode_value = _STOP_MODE_TO_VALUE.get(mode.upper() if isinstance(mode, str) else mode)
+        if mode_value is None:
             raise ValueError("Invalid stop mode")
         
         if axis is None:
             # Stop all axes
-            self._send_command(f"STOP_{mode_value}")
+            self._send_command(b"STOP_%d" % mode_value)
         else:
             # Stop specific axis
             self.select_axis(axis)
-            self._send_command(f":STOP_{mode_value}")
+            self._send_command(b":STOP_%d" % mode_value)
     
     # -------------------------------------------------------------------------
     # Status Request Commands
@@ -836,12 +1245,31 @@ class MisumiXYWrapper:
         Returns:
             float: Current position
         """
-        self.select_axis(axis)
-        response = self._send_command(":POS?")
-        position = float(response)
-        logger.debug(f"Position of axis {axis}: {position}")
+        position = float(self._send_axis_command(axis, b":POS?"))
+        logger.debug("Position of axis %s: %s", axis, position)
         return position
     
+    def get_positions(self, axes: Iterable[Union[AxisName, int, str]]) -> Dict[Union[AxisName, int, str], float]:
+        """
+        Get current positions of several axes in a single serial exchange.
+
+        Args:
+            axes (Iterable[Union[AxisName, int, str]]): Axes to get positions
+
+        Returns:
+            Dict[Union[AxisName, int, str], float]: Current position keyed by the requested axis
+        """
+        axes = list(axes)
+        commands = []
+        for axis in axes:
+            commands.append(_AXI_COMMANDS[str(self._resolve_axis(axis))])
+            commands.append(b":POS?")
+        
+        responses = self._send_commands_pipelined(commands)
+        positions = {axis: float(responses[2 * i + 1]) for i, axis in enumerate(axes)}
+        logger.debug("Positions: %s", positions)
+        return positions
+    
     def get_status(self, axis: Union[AxisName, int, str]) -> Dict[str, bool]:
         """
         Get status of the specified axis.
@@ -852,37 +1280,26 @@ class MisumiXYWrapper:
         Returns:
             Dict[str, bool]: Status dictionary
         """
-        self.select_axis(axis)
+        flags = int(self.get_status_flags(axis))
+        return {key: bool(flags & mask) for key, mask in _STATUS_FIELDS}
+    
+    def get_status_flags(self, axis: Union[AxisName, int, str]) -> AxisStatus:
+        """
+        Get status of the specified axis as flags.
         
-        # Get status binary 1
-        sb1 = int(self._send_command(":SB1?"))
-        # Get status binary 2
-        sb2 = int(self._send_command(":SB2?"))
-        # Get status binary 3
-        sb3 = int(self._send_command(":SB3?"))
-        
-        status = {
-            "program_driving": bool(sb1 & 0b10000000),
-            "in_motion": bool(sb1 & 0b01000000),
-            "home_position_detected": bool(sb1 & 0b00100000),
-            "origin_detected": bool(sb1 & 0b00010000),
-            "discontinued": bool(sb1 & 0b00001000),
-            "soft_limit_detected": bool(sb1 & 0b00000100),
-            "mechanical_limit_detected": bool(sb1 & 0b00000010),
-            "direction_cw": bool(sb1 & 0b00000001),
-            
-            "cw_mechanical_limit_detected": bool(sb2 & 0b00000001),
-            "ccw_mechanical_limit_detected": bool(sb2 & 0b00000010),
-            "cw_soft_limit_detected": bool(sb2 & 0b00000100),
-            "ccw_soft_limit_detected": bool(sb2 & 0b00001000),
-            "cw_soft_limit_enabled": bool(sb2 & 0b00010000),
-            "ccw_soft_limit_enabled": bool(sb2 & 0b00100000),
+        Cheaper than get_status when polling: test bits with e.g.
+        ``stage.get_status_flags(1) & AxisStatus.IN_MOTION``.
+        
+        Args:
+            axis (Union[AxisName, int, str]): Axis to get status
             
-            "axis_selection_available": bool(sb3 & 0b00000001),
-            "micro_step_driver": bool(sb3 & 0b00000010) or bool(sb3 & 0b00010000),
-        }
+        Returns:
+            AxisStatus: Status binaries 1-3 combined into one value
+        """
+        # Select the axis and get status binaries 1-3 in a single exchange
+        sb1, sb2, sb3 = map(int, self._send_axis_commands(axis, [b":SB1?", b":SB2?", b":SB3?"]))
         
-        return status
+        return AxisStatus(sb1 | sb2 << 8 | sb3 << 16)
     
     def is_in_motion(self, axis: Union[AxisName, int, str]) -> bool:
         """
@@ -894,9 +1311,7 @@ class MisumiXYWrapper:
         Returns:
             bool: True if the axis is in motion, False otherwise
         """
-        self.select_axis(axis)
-        response = self._send_command(":MOTION?")
-        return response == "1"
+        return self._send_axis_command(axis, b":MOTION?") == "1"
     
     def is_ready(self, axis: Union[AxisName, int, str]) -> bool:
         """
@@ -908,9 +1323,7 @@ class MisumiXYWrapper:
         Returns:
             bool: True if the axis is ready, False otherwise
         """
-        self.select_axis(axis)
-        response = self._send_command(":READY?")
-        return response == "1"
+        return self._send_axis_command(axis, b":READY?") == "1"
     
     def is_emergency_stop_active(self) -> bool:
         """
@@ -929,18 +1342,23 @@ class MisumiXYWrapper:
         Returns:
             Dict[str, bool]: Motion status dictionary
         """
-        response = int(self._send_command("MOTIONA?"))
+        return self.are_axes_in_motion(_AXIS_NAMES)
+    
+    def are_axes_in_motion(self, axes: Iterable[Union[AxisName, int, str]] = (AxisName.X, AxisName.Y)) -> Dict[Union[AxisName, int, str], bool]:
+        """
+        Check which of the specified axes are in motion with a single query.
         
-        status = {
-            "X": bool(response & 0b00000001),
-            "Y": bool(response & 0b00000010),
-            "Z": bool(response & 0b00000100),
-            "U": bool(response & 0b00001000),
-            "V": bool(response & 0b00010000),
-            "W": bool(response & 0b00100000),
+        Args:
+            axes (Iterable[Union[AxisName, int, str]], optional): Axes to check. Defaults to X and Y.
+            
+        Returns:
+            Dict[Union[AxisName, int, str], bool]: Motion status keyed by the requested axis
+        """
+        motion = int(self._send_command("MOTIONA?"))
+        return {
+            axis: bool(motion & _AXIS_MOTION_BITS[self._resolve_axis_name(axis)])
+            for axis in axes
         }
-        
-        return status
     
     def get_controller_version(self) -> str:
         """
@@ -969,7 +1387,7 @@ class MisumiXYWrapper:
         if not 0 <= input_number <= 47:
             raise ValueError("Input number must be between 0 and 47")
         
-        response = self._send_command(f"IN{input_number:02d}?")
+        response = self._send_command(_INPUT_QUERIES[input_number])
         return response == "1"
     
     def get_input_port_status(self, port_number: int) -> int:
@@ -985,7 +1403,7 @@ class MisumiXYWrapper:
         if not 0 <= port_number <= 2:
             raise ValueError("Port number must be between 0 and 2")
         
-        response = self._send_command(f"INP{port_number}?")
+        response = self._send_command(_INPUT_PORT_QUERIES[port_number])
         return int(response)
     
     def set_output(self, output_number: int, state: bool) -> None:
@@ -999,7 +1417,7 @@ class MisumiXYWrapper:
         if not 0 <= output_number <= 35:
             raise ValueError("Output number must be between 0 and 35")
         
-        self._send_command(f"OUT{output_number:02d}_{1 if state else 0}")
+        self._send_command((_OUTPUT_ON_COMMANDS if state else _OUTPUT_OFF_COMMANDS)[output_number])
     
     def set_output_port(self, port_number: int, value: int) -> None:
         """
@@ -1029,7 +1447,7 @@ class MisumiXYWrapper:
         if not 0 <= port_number <= 2:
             raise ValueError("Port number must be between 0 and 2")
         
-        response = self._send_command(f"OUTP{port_number}?")
+        response = self._send_command(_OUTPUT_PORT_QUERIES[port_number])
         return int(response)
     
     # -------------------------------------------------------------------------
@@ -1061,6 +1479,9 @@ class MisumiXYWrapper:
             raise ValueError('Mode must be "RUN" or "STEP"')
         
         self._send_command(f"PRG {mode.upper()}")
+        # The program can select axes and change parameters on its own
+        self._selected_axis = None
+        self._last_params.clear()
     
     def get_program_number(self) -> int:
         """
@@ -1097,8 +1518,10 @@ class MisumiXYWrapper:
             raise ValueError("Program number must be between 0 and 7")
         
         self._send_command(f"DELPRG {program_number}")
-        # Wait for the delete operation to complete
-        time.sleep(0.5)
+        # Wait for the delete operation to complete (at most the old 0.5 s sleep;
+        # a late reply is drained by _wait_until_ready)
+        if not self._wait_until_ready(0.5):
+            logger.warning("Controller not ready after deleting program %s", program_number)
     
     def set_program_step(self, program_number: int, step_number: int, command: str) -> None:
         """
@@ -1115,9 +1538,39 @@ class MisumiXYWrapper:
             raise ValueError("Step number must be between 0 and 99")
         
         self._send_command(f"SETPRG {program_number}, {step_number}, {command}")
-        # Wait for the set operation to complete
-        time.sleep(0.03)
-    
+        # Wait for the set operation to complete. The budget covers the old 30 ms
+        # sleep plus the query round-trip with margin; a reply that still comes
+        # late is drained by _wait_until_ready, so the link stays in sync.
+        if not self._wait_until_ready(0.2):
+            logger.warning("Controller not ready after setting program %s step %s", program_number, step_number)
+
+    def upload_program(self, program_number: int, steps: List[str]) -> None:
+        """
+        Set a whole program, starting at step 0.
+
+        The SETPRG commands are pipelined in batches and the controller is
+        checked for readiness once at the end, instead of waiting after every
+        step as set_program_step does.
+
+        Args:
+            program_number (int): Program number (0-7)
+            steps (List[str]): Commands for steps 0, 1, ... (at most 100)
+        """
+        if not 0 <= program_number <= 7:
+            raise ValueError("Program number must be between 0 and 7")
+        if len(steps) > 100:
+            raise ValueError("A program can have at most 100 steps")
+
+        commands = [
+            f"SETPRG {program_number}, {step_number}, {command}".encode()
+            for step_number, command in enumerate(steps)
+        ]
+        for start in range(0, len(commands), _PROGRAM_UPLOAD_BATCH):
+            self._send_commands_pipelined(commands[start:start + _PROGRAM_UPLOAD_BATCH])
+        # Wait for the set operations to complete
+        if not self._wait_until_ready(0.5):
+            logger.warning("Controller not ready after uploading program %s", program_number)
+
     def get_program_step(self, program_number: int, step_number: int) -> str:
         """
         Get a program step.
@@ -1152,11 +1605,14 @@ class MisumiXYWrapper:
         Returns:
             bool: True if the axis stopped within the timeout, False otherwise
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if not self.is_in_motion(axis):
+        deadline = time.monotonic() + timeout
+        delay = _POLL_MIN_INTERVAL
+        while time.monotonic() < deadline:
+            # MOTIONA? needs no axis selection, so each poll is one command
+            if not self.are_axes_in_motion((axis,))[axis]:
                 return True
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, _POLL_MAX_INTERVAL)
         
         return False
     
@@ -1170,12 +1626,14 @@ class MisumiXYWrapper:
         Returns:
             bool: True if all axes stopped within the timeout, False otherwise
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        deadline = time.monotonic() + timeout
+        delay = _POLL_MIN_INTERVAL
+        while time.monotonic() < deadline:
             status = self.get_all_axes_motion_status()
             if not any(status.values()):
                 return True
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, _POLL_MAX_INTERVAL)
         
         return False
     
@@ -1194,17 +1652,16 @@ class MisumiXYWrapper:
         self.drive(AxisName.X, DriveMode.HOME)
         self.drive(AxisName.Y, DriveMode.HOME)
 
-        # Wait for both axes to complete homing
-        while not self.wait_for_stop(AxisName.X, timeout=timeout) or not self.wait_for_stop(AxisName.Y, timeout=timeout):
-            pass
-
-        # Return True only if both succeeded
-        return True
+        # Wait for both axes to complete homing (one MOTIONA? per poll covers both)
+        return self.wait_for_all_axes_stop(timeout=timeout)
     
     def move_to_position(self, positions: Dict[Union[AxisName, int, str], float], timeout: float = 30.0) -> bool:
         """
         Move to the specified positions.
 
+        Multi-axis moves are sent as a single GOLA command, so all axes start
+        together and only one round-trip is paid; single-axis moves use GOABS.
+
         Args:
             positions (Dict[Union[AxisName, int, str], float]): Dictionary of axis positions
                 Key: Axis (X, Y, Z, U, V, W)
@@ -1217,14 +1674,44 @@ class MisumiXYWrapper:
         # Use linear interpolation for multi-axis moves (faster and coordinated)
         if len(positions) > 1:
             self.drive_linear_absolute(positions)
-        else:
+        elif positions:
             # Single axis move
-            for axis, position in positions.items():
-                self.drive_absolute(axis, position)
+            (axis, position), = positions.items()
+            self.drive_absolute(axis, position)
 
         # Wait for all axes to stop
         return self.wait_for_all_axes_stop(timeout=timeout)
-    
+
+    def scan_positions(self, path: Iterable[Tuple[float, float]],
+                       on_arrive: Callable[[int, float, float], Any],
+                       timeout: float = 30.0) -> bool:
+        """
+        Visit a sequence of XY positions, calling back at each one.
+
+        The move to position k+1 is sent as soon as ``on_arrive`` returns for
+        position k, with no extra round-trips in between. Capture cannot overlap
+        the next move since the image must be taken while the stage is still, so
+        the callback should return once the frame is grabbed and leave any
+        processing or saving to another thread.
+
+        Args:
+            path (Iterable[Tuple[float, float]]): (x, y) positions in visiting order,
+                e.g. from WellPlateCalculator.get_scan_path()
+            on_arrive (Callable[[int, float, float], Any]): Called as
+                ``on_arrive(index, x, y)`` once the stage has stopped at each position
+            timeout (float, optional): Timeout in seconds for each move. Defaults to 30.0.
+
+        Returns:
+            bool: True if every position was reached, False if a move timed out
+                (the scan stops at that position)
+        """
+        for index, (x, y) in enumerate(path):
+            x, y = float(x), float(y)
+            if not self.move_to_position({AxisName.X: x, AxisName.Y: y}, timeout=timeout):
+                return False
+            on_arrive(index, x, y)
+        return True
+
     def jog(self, axis: Union[AxisName, int, str], direction: Union[Direction, int, str]) -> None:
         """
         Jog the specified axis in the specified direction.
@@ -1235,22 +1722,108 @@ class MisumiXYWrapper:
                 0 or CW: Jog in CW direction
                 1 or CCW: Jog in CCW direction
         """
-        if isinstance(direction, Direction):
-            if direction == Direction.CW:
-                self.drive(axis, DriveMode.CWJ)
-            else:
-                self.drive(axis, DriveMode.CCWJ)
-        elif isinstance(direction, int) and direction in [0, 1]:
-            if direction == 0:
-                self.drive(axis, DriveMode.CWJ)
-            else:
-                self.drive(axis, DriveMode.CCWJ)
-        elif isinstance(direction, str):
-            if direction.upper() == "CW":
-                self.drive(axis, DriveMode.CWJ)
-            elif direction.upper() == "CCW":
-                self.drive(axis, DriveMode.CCWJ)
-            else:
+        if isinstance(direction, str):
+            mode = _JOG_DIRECTION_TO_DRIVE_MODE.get(direction.upper())
+            if mode is None:
                 raise ValueError("Invalid direction. Must be 'CW' or 'CCW'")
         else:
-            raise ValueError("Invalid direction. Must be Direction.CW, Direction.CCW, 0, 1, 'CW', or 'CCW'")
+            mode = _JOG_DIRECTION_TO_DRIVE_MODE.get(direction)
+            if mode is None:
+                raise ValueError("Invalid direction. Must be Direction.CW, Direction.CCW, 0, 1, 'CW', or 'CCW'")
+        
+        self.drive(axis, mode)
+
+
+class AsyncMisumiXYWrapper:
+    """
+    An asyncio front end for MisumiXYWrapper.
+    
+    Every public method of the wrapped controller is available as a coroutine
+    with the same arguments, e.g. ``await stage.drive_absolute(AxisName.X, 100)``.
+    The calls run one at a time on a dedicated worker thread, so commands keep
+    their order on the serial link while the event loop stays free to capture
+    images or serve requests. Plain attributes (port, connected, ...) are
+    returned as-is.
+    """
+
+    def __init__(self, stage: MisumiXYWrapper, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize the AsyncMisumiXYWrapper.
+
+        Args:
+            stage (MisumiXYWrapper): Connected controller to drive
+            executor (Optional[ThreadPoolExecutor], optional): Single-worker executor to run
+                the calls on. Defaults to a new one.
+        """
+        self.stage = stage
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="misumi")
+
+    @classmethod
+    async def open(cls, port: str, baudrate: int = 38400, timeout: float = 1.0,
+                   auto_initialize: bool = False) -> "AsyncMisumiXYWrapper":
+        """
+        Connect to the controller without blocking the event loop.
+
+        Args:
+            port (str): Serial port name (e.g., 'COM1', '/dev/ttyUSB0')
+            baudrate (int, optional): Baud rate. Defaults to 38400.
+            timeout (float, optional): Serial timeout in seconds. Defaults to 1.0.
+            auto_initialize (bool, optional): Automatically initialize the stage (home axes). Defaults to False.
+
+        Returns:
+            AsyncMisumiXYWrapper: Wrapper around the connected controller
+        """
+        # Connect on the thread that will run the later calls
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="misumi")
+        loop = asyncio.get_running_loop()
+        try:
+            stage = await loop.run_in_executor(
+                executor, MisumiXYWrapper, port, baudrate, timeout, auto_initialize)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return cls(stage, executor)
+
+    async def run(self, func, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the controller's worker thread.
+
+        Useful for sequences that must not be interleaved with other calls,
+        e.g. starting the moves of several axes back to back.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def close(self) -> bool:
+        """
+        Disconnect from the controller and stop the worker thread.
+
+        Returns:
+            bool: True if disconnection is successful, False otherwise.
+        """
+        try:
+            return await self.run(self.stage.disconnect)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("stage", "_executor"):
+            raise AttributeError(name)
+
+        attr = getattr(self.stage, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        return call
@@ -6,10 +6,26 @@ utilities to calculate XY positions based on well coordinates and
 sub-well positions.
 """
 
+import re
 from enum import Enum
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the grid kernel runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Row letter(s) followed by the column number, e.g. 'B12'
+_WELL_NAME_RE = re.compile(r"([A-Z]+)([0-9]+)")
+
 
 class WellPosition(Enum):
     """Enum for positions within a well"""
@@ -20,6 +36,22 @@ class WellPosition(Enum):
     RIGHT = "right"
 
 
+@njit(cache=True)
+def _grid(rows, cols, spacing_x, spacing_y, origin_x, origin_y):
+    """
+    Compute the center of every well as a (rows * cols, 2) array in row-major order.
+
+    Stage moves to lower X values with increasing column, and lower Y values
+    with increasing row.
+    """
+    out = np.empty((rows * cols, 2))
+    for i in range(rows):
+        for j in range(cols):
+            out[i * cols + j, 0] = origin_x - j * spacing_x
+            out[i * cols + j, 1] = origin_y - i * spacing_y
+    return out
+
+
 @dataclass
 class WellPlateConfig:
     """Configuration for a well plate"""
@@ -70,6 +102,16 @@ class WellPlateCalculator:
         plate_origin_y=32000   # A1 Y position
     )
 
+    # Offset from the well center for each position within a well
+    # Using 1800 steps offset for edge positions
+    _POSITION_OFFSETS: Dict[WellPosition, Tuple[float, float]] = {
+        WellPosition.CENTER: (0.0, 0.0),     # No offset
+        WellPosition.TOP: (0.0, 1800.0),     # Top means up (increase Y)
+        WellPosition.BOTTOM: (0.0, -1800.0), # Bottom means down (decrease Y)
+        WellPosition.LEFT: (-1800.0, 0.0),   # Left means left (decrease X)
+        WellPosition.RIGHT: (1800.0, 0.0),   # Right means right (increase X)
+    }
+
     def __init__(self, config: WellPlateConfig = None):
         """
         Initialize the calculator with a well plate configuration.
@@ -78,6 +120,49 @@ class WellPlateCalculator:
             config: WellPlateConfig object. Defaults to standard 96-well plate.
         """
         self.config = config or self.STANDARD_96_WELL
+        self._wells: List[str] = []
+        self._well_index: Dict[str, Tuple[int, int]] = {}
+        self._coords: np.ndarray = np.empty((0, 2))
+        self._center_cache: Dict[str, Tuple[float, float]] = {}
+        self._position_cache: Dict[Tuple[str, WellPosition], Tuple[float, float]] = {}
+        self._build_well_index()
+        self._build_position_cache()
+
+    def _build_well_index(self):
+        """
+        Precompute the well names in plate order and their 0-based (row, col)
+        indices so that parsing a well name is a single dict lookup. Both the
+        canonical and the lowercase name (e.g. 'B3' and 'b3') are indexed.
+        """
+        self._wells = []
+        self._well_index = {}
+        for row in range(self.config.rows):
+            row_letter = chr(ord('A') + row)
+            for col in range(self.config.cols):
+                well = f"{row_letter}{col + 1}"
+                self._wells.append(well)
+                self._well_index[well] = self._well_index[well.lower()] = (row, col)
+
+    def _build_position_cache(self):
+        """
+        Precompute the center of every well and the coordinates of every position
+        in every well so that get_well_center and get_well_position are a single
+        dict lookup for any indexed well name.
+        """
+        config = self.config
+        # Fixed argument types so numba compiles a single signature (at the first
+        # calculator, built at import in the app) instead of another one inside a
+        # request handler once the origin changes from int to float
+        self._coords = _grid(int(config.rows), int(config.cols),
+                             float(config.well_spacing_x), float(config.well_spacing_y),
+                             float(config.plate_origin_x), float(config.plate_origin_y))
+        self._center_cache = {}
+        self._position_cache = {}
+        for well, (row_idx, col_idx) in self._well_index.items():
+            center_x, center_y = self._well_center(row_idx, col_idx)
+            self._center_cache[well] = (center_x, center_y)
+            for position in WellPosition:
+                self._position_cache[(well, position)] = self._offset_position(center_x, center_y, position)
 
     def parse_well_name(self, well_name: str) -> Tuple[int, int]:
         """
@@ -92,22 +177,22 @@ class WellPlateCalculator:
         Raises:
             ValueError: If the well name is invalid
         """
+        indices = self._well_index.get(well_name)
+        if indices is not None:
+            return indices
+
         well_name = well_name.strip().upper()
+        indices = self._well_index.get(well_name)
+        if indices is not None:
+            return indices
 
-        if len(well_name) < 2:
+        # Not a well on this plate; parse it to report what is wrong
+        match = _WELL_NAME_RE.fullmatch(well_name)
+        if not match:
             raise ValueError(f"Invalid well name: {well_name}")
 
-        # Extract row letter(s)
-        row_part = ""
-        col_part = ""
-        for char in well_name:
-            if char.isalpha():
-                row_part += char
-            elif char.isdigit():
-                col_part += char
-
-        if not row_part or not col_part:
-            raise ValueError(f"Invalid well name: {well_name}")
+        # Row letter(s) and column number
+        row_part, col_part = match.groups()
 
         # Convert row letter to index (A=0, B=1, ...)
         row_index = 0
@@ -135,13 +220,16 @@ class WellPlateCalculator:
         Returns:
             Tuple of (x, y) coordinates
         """
-        row_idx, col_idx = self.parse_well_name(well_name)
+        try:
+            return self._center_cache[well_name]
+        except KeyError:
+            row_idx, col_idx = self.parse_well_name(well_name)
+            return self._well_center(row_idx, col_idx)
 
-        # Stage moves to lower X values from col 1 to 6, and lower Y values from row A to D
-        x = self.config.plate_origin_x - (col_idx * self.config.well_spacing_x)
-        y = self.config.plate_origin_y - (row_idx * self.config.well_spacing_y)
-
-        return x, y
+    def _well_center(self, row_idx: int, col_idx: int) -> Tuple[float, float]:
+        """Get the XY coordinates of a well center from 0-based row and column indices"""
+        x, y = self._coords[row_idx * self.config.cols + col_idx]
+        return float(x), float(y)
 
     def get_well_position(self, well_name: str, position: WellPosition) -> Tuple[float, float]:
         """
@@ -154,43 +242,96 @@ class WellPlateCalculator:
         Returns:
             Tuple of (x, y) coordinates in mm
         """
-        center_x, center_y = self.get_well_center(well_name)
-
-        # Calculate offset from center based on position
-        # Using 1800 steps offset for edge positions
-        offset_distance = 1800
-
-        offset_x = 0.0
-        offset_y = 0.0
-
-        if position == WellPosition.CENTER:
-            pass  # No offset
-        elif position == WellPosition.TOP:
-            offset_y = offset_distance  # Top means up (increase Y)
-        elif position == WellPosition.BOTTOM:
-            offset_y = -offset_distance  # Bottom means down (decrease Y)
-        elif position == WellPosition.LEFT:
-            offset_x = -offset_distance  # Left means left (decrease X)
-        elif position == WellPosition.RIGHT:
-            offset_x = offset_distance  # Right means right (increase X)
-
+        try:
+            return self._position_cache[(well_name, position)]
+        except KeyError:
+            # Padded or mixed-case name (e.g. " A1") or invalid well; parsing normalizes or raises
+            center_x, center_y = self.get_well_center(well_name)
+            return self._offset_position(center_x, center_y, position)
+
+    def _offset_position(self, center_x: float, center_y: float, position: WellPosition) -> Tuple[float, float]:
+        """Apply the offset for a position within a well to the well center"""
+        offset_x, offset_y = self._POSITION_OFFSETS[position]
         return center_x + offset_x, center_y + offset_y
 
-    def get_all_wells(self) -> list[str]:
+    def get_all_wells(self, order: str = "row") -> list[str]:
         """
         Get a list of all well names in the plate.
 
+        Args:
+            order: 'row' for row-major order, or 'snake' to reverse every other
+                row so consecutive wells are always one spacing apart (for scans)
+
         Returns:
             List of well names (e.g., ['A1', 'A2', ..., 'H12'])
         """
+        if order == "row":
+            return list(self._wells)
+        if order != "snake":
+            raise ValueError(f"Invalid order: {order}")
+
+        cols = self.config.cols
         wells = []
         for row in range(self.config.rows):
-            row_letter = chr(ord('A') + row)
-            for col in range(self.config.cols):
-                col_number = col + 1
-                wells.append(f"{row_letter}{col_number}")
+            row_wells = self._wells[row * cols:(row + 1) * cols]
+            wells.extend(reversed(row_wells) if row % 2 else row_wells)
         return wells
 
+    def get_all_centers(self) -> np.ndarray:
+        """
+        Get the center of every well at once.
+
+        Returns:
+            (rows * cols, 2) float array of (x, y) coordinates in get_all_wells() order
+        """
+        return self._coords.copy()
+
+    def get_all_positions(self, position: WellPosition) -> np.ndarray:
+        """
+        Get the coordinates of a position within every well at once.
+
+        Args:
+            position: Position within the well (center, top, bottom, etc.)
+
+        Returns:
+            (rows * cols, 2) float array of (x, y) coordinates in get_all_wells() order
+        """
+        return self._coords + np.asarray(self._POSITION_OFFSETS[position])
+
+    def get_scan_path(self, wells: List[str] = None,
+                      positions: Tuple[WellPosition, ...] = (WellPosition.CENTER,)) -> np.ndarray:
+        """
+        Get the stage coordinates for scanning a set of wells.
+
+        Wells are visited row by row in snake order (columns alternate direction
+        on every other visited row, whatever rows are skipped) to keep travel
+        between wells short. Each well's positions are visited consecutively,
+        in the order given.
+
+        Args:
+            wells: Well names to scan. Defaults to every well on the plate.
+            positions: Positions to visit within each well
+
+        Returns:
+            (M, 2) float array of (x, y) coordinates, M = len(wells) * len(positions)
+        """
+        if wells is None:
+            wells = self._wells
+        cols = self.config.cols
+        by_row: Dict[int, List[int]] = {}
+        for well in wells:
+            row, col = self.parse_well_name(well)
+            by_row.setdefault(row, []).append(col)
+        flat = []
+        # Direction alternates by rank among the visited rows, not by row index
+        for rank, row in enumerate(sorted(by_row)):
+            row_cols = sorted(by_row[row], reverse=rank % 2 == 1)
+            flat.extend(row * cols + col for col in row_cols)
+        flat = np.array(flat, dtype=np.intp)
+        offsets = np.array([self._POSITION_OFFSETS[p] for p in positions], dtype=float).reshape(-1, 2)
+        path = self._coords[flat][:, None, :] + offsets[None, :, :]
+        return path.reshape(-1, 2)
+
     def update_origin(self, x: float, y: float):
         """
         Update the plate origin coordinates.
@@ -201,3 +342,4 @@ class WellPlateCalculator:
         """
         self.config.plate_origin_x = x
         self.config.plate_origin_y = y
+        self._build_position_cache()